@@ -1,5 +1,7 @@
 """A Nintendo application."""
 
+import logging
+
 from datetime import datetime
 
 from .const import _LOGGER
@@ -20,13 +22,10 @@ class Application:
 
     def update_today_time_played(self, daily_summary: dict):
         """Updates the today time played for the given application."""
-        _LOGGER.debug("Updating today time played for app %s",
-                      self.application_id)
         self.today_time_played = daily_summary.get("playingTime", 0)
 
     def update(self, updated: 'Application'):
         """Updates self with a given application."""
-        _LOGGER.debug("Updating application %s", self.application_id)
         self.application_id = updated.application_id
         self.first_played_date = updated.first_played_date
         self.has_ugc = updated.has_ugc
@@ -68,8 +67,10 @@ class Application:
     def from_whitelist(cls, raw: dict) -> list['Application']:
         """Converts a raw whitelist response into a list of applications."""
         parsed = []
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         for app_id in raw:
-            _LOGGER.debug("Parsing app %s", app_id)
+            if debug:
+                _LOGGER.debug("Parsing app %s", app_id)
             internal = cls()
             internal.application_id = raw[app_id]["applicationId"]
             internal.first_played_date = datetime.strptime(raw[app_id]["firstPlayDate"], "%Y-%m-%d")
@@ -82,8 +83,10 @@ class Application:
     def from_monthly_summary(cls, raw: list) -> list['Application']:
         """Converts a raw monthly summary response into a list of applications."""
         parsed = []
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         for app in raw:
-            _LOGGER.debug("Parsing app %s", app)
+            if debug:
+                _LOGGER.debug("Parsing app %s", app)
             internal = cls()
             internal.application_id = app.get("applicationId").capitalize()
             internal.first_played_date = datetime.strptime(app.get("firstPlayDate"), "%Y-%m-%d")
@@ -2,6 +2,7 @@
 """Defines a single Nintendo Switch device."""
 
 import asyncio
+import logging
 
 from datetime import datetime, timedelta, time
 
@@ -24,7 +25,7 @@ class Device:
         self._api: Api = api
         self.daily_summaries: dict = {}
         self.parental_control_settings: dict = {}
-        self.players: list[Player] = []
+        self._players_by_id: dict[str, Player] = {}
         self.limit_time: int = 0
         self.timer_mode: str = ""
         self.today_playing_time: int = 0
@@ -54,12 +55,17 @@ class Device:
                 self.get_monthly_summary(),
                 self._get_extras()
         )
-        if self.players is None:
-            self.players = Player.from_device_daily_summary(self.daily_summaries)
+        if not self._players_by_id:
+            self._players_by_id = Player.index_from_device_daily_summary(self.daily_summaries)
         else:
-            for player in self.players:
+            for player in self._players_by_id.values():
                 player.update_from_daily_summary(self.daily_summaries)
 
+    @property
+    def players(self) -> list[Player]:
+        """Returns the players of the device."""
+        return list(self._players_by_id.values())
+
     async def set_new_pin(self, pin: str):
         """Updates the pin for the device."""
         _LOGGER.debug(">> Device.set_new_pin(pin=REDACTED)")
@@ -214,25 +220,29 @@ class Device:
         )
         self.daily_summaries = response["json"]["items"]
         _LOGGER.debug("New daily summary %s", self.daily_summaries)
+        summary_error = None
         try:
-            today_playing_time = self.get_date_summary()[0].get("playingTime", 0)
+            today_summary = self.get_date_summary()[0]
+        except ValueError as err:
+            _LOGGER.debug("Unable to update daily summary for device %s: %s", self.name, err)
+            today_summary = None
+            summary_error = err
+        self.stats_update_failed = today_summary is None
+        if today_summary is not None:
+            today_playing_time = today_summary.get("playingTime", 0)
             self.today_playing_time = None if today_playing_time is None else today_playing_time/60
-            today_disabled_time = self.get_date_summary()[0].get("disabledTime", 0)
+            today_disabled_time = today_summary.get("disabledTime", 0)
             self.today_disabled_time = None if today_disabled_time is None else today_disabled_time/60
-            today_exceeded_time = self.get_date_summary()[0].get("exceededTime", 0)
+            today_exceeded_time = today_summary.get("exceededTime", 0)
             self.today_exceeded_time = None if today_exceeded_time is None else today_exceeded_time/60
             _LOGGER.debug("Cached playing, disabled and exceeded time for today for device %s",
                         self.device_id)
 
-            self.today_important_info = self.get_date_summary()[0].get("importantInfos", [])
-            self.today_notices = self.get_date_summary()[0].get("notices", [])
-            self.today_observations = self.get_date_summary()[0].get("observations", [])
+            self.today_important_info = today_summary.get("importantInfos", [])
+            self.today_notices = today_summary.get("notices", [])
+            self.today_observations = today_summary.get("observations", [])
             _LOGGER.debug("Cached today important info, notices and observations for device %s",
                         self.device_id)
-            self.stats_update_failed = False
-        except ValueError as err:
-            _LOGGER.debug("Unable to update daily summary for device %s: %s", self.name, err)
-            self.stats_update_failed = True
 
         current_month = datetime(
             year=datetime.now().year,
@@ -247,28 +257,35 @@ class Device:
         self.month_playing_time = month_playing_time
         _LOGGER.debug("Cached current month playing time for device %s", self.device_id)
         parsed_apps = Application.from_daily_summary(self.daily_summaries)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         for app in parsed_apps:
             try:
                 int_app = self.get_application(app.application_id)
-                _LOGGER.debug("Updating cached app state %s for device %s",
-                              int_app.application_id,
-                              self.device_id)
+                if debug:
+                    _LOGGER.debug("Updating cached app state %s for device %s",
+                                  int_app.application_id,
+                                  self.device_id)
                 int_app.update(app)
             except ValueError:
-                _LOGGER.debug("Creating new cached application entry %s for device %s",
-                              app.application_id,
-                              self.device_id)
+                if debug:
+                    _LOGGER.debug("Creating new cached application entry %s for device %s",
+                                  app.application_id,
+                                  self.device_id)
                 self.applications.append(app)
 
         # update application playtime
-        try:
-            for player in self.get_date_summary()[0].get("devicePlayers", []):
-                for app in player.get("playedApps", []):
-                    self.get_application(app["applicationId"]).update_today_time_played(app)
-            self.application_update_failed = False
-        except ValueError as err:
-            _LOGGER.warning("Unable to retrieve applications for device %s: %s", self.name, err)
+        if today_summary is None:
+            _LOGGER.warning("Unable to retrieve applications for device %s: %s", self.name, summary_error)
             self.application_update_failed = True
+        else:
+            try:
+                for player in today_summary.get("devicePlayers", []):
+                    for app in player.get("playedApps", []):
+                        self.get_application(app["applicationId"]).update_today_time_played(app)
+                self.application_update_failed = False
+            except ValueError as err:
+                _LOGGER.warning("Unable to retrieve applications for device %s: %s", self.name, err)
+                self.application_update_failed = True
 
     async def _get_extras(self):
         """Retrieve extra properties."""
@@ -377,10 +394,9 @@ class Device:
 
     def get_player(self, player_id: str) -> Player:
         """Returns a player."""
-        player = [x for x in self.players
-                  if x.player_id == player_id]
-        if len(player) == 1:
-            return player[0]
+        player = self._players_by_id.get(player_id)
+        if player is not None:
+            return player
         raise ValueError("Player not found.")
 
     @classmethod
@@ -4,19 +4,29 @@ from .const import _LOGGER
 
 class Player:
     """Defines a single player on a Nintendo device."""
-    def __init__(self):
+
+    __slots__ = ("player_image", "nickname", "apps", "player_id", "playing_time")
+
+    def __init__(self,
+                 player_id: str = None,
+                 player_image: str = None,
+                 nickname: str = None,
+                 playing_time: int = None,
+                 apps: list = None):
         """Init a player."""
-        self.player_image: str = None
-        self.nickname: str = None
-        self.apps: list = []
-        self.player_id: str = None
-        self.playing_time: int = None
+        self.player_image: str = player_image
+        self.nickname: str = nickname
+        self.apps: list = [] if apps is None else apps
+        self.player_id: str = player_id
+        self.playing_time: int = playing_time
 
     def update_from_daily_summary(self, raw: list[dict]):
         """Update the current instance of the player from the daily summery"""
         _LOGGER.debug("Updating player %s daily summary", self.player_id)
+        if not raw:
+            return
         for player in raw[0].get("devicePlayers", []):
-            if self.player_id is player.get("playerId"):
+            if self.player_id == player.get("playerId"):
                 self.player_id = player.get("playerId")
                 self.player_image = player.get("imageUri")
                 self.nickname = player.get("nickname")
@@ -27,15 +37,19 @@ class Player:
     @classmethod
     def from_device_daily_summary(cls, raw: list[dict]) -> list['Player']:
         """Converts a daily summary response into a list of players."""
-        players = []
         _LOGGER.debug("Building players from device daily summary.")
-        for player in raw[0].get("devicePlayers", []):
-            parsed = cls()
-            parsed.player_id = player.get("playerId")
-            parsed.player_image = player.get("imageUri")
-            parsed.nickname = player.get("nickname")
-            parsed.playing_time = player.get("playingTime")
-            parsed.apps = player.get("playedApps")
-            players.append(parsed)
-            _LOGGER.debug("Built player %s", parsed.player_id)
-        return players
+        if not raw:
+            return []
+        return [
+            cls(player_id=player.get("playerId"),
+                player_image=player.get("imageUri"),
+                nickname=player.get("nickname"),
+                playing_time=player.get("playingTime"),
+                apps=player.get("playedApps"))
+            for player in raw[0].get("devicePlayers", [])
+        ]
+
+    @classmethod
+    def index_from_device_daily_summary(cls, raw: list[dict]) -> dict[str, 'Player']:
+        """Converts a daily summary response into a dict of players keyed by player id."""
+        return {p.player_id: p for p in cls.from_device_daily_summary(raw)}
@@ -2,12 +2,14 @@ import re
 
 import setuptools
 
+VERSION_RE = re.compile(r"^__version__ = ['\"]([^'\"]*)['\"]", re.M)
+
 with open('README.md', 'r') as readme_file:
     long_description = readme_file.read()
 
 # Inspiration: https://stackoverflow.com/a/7071358/6064135
 with open('pynintendoparental/const.py', 'r') as version_file:
-    version_groups = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", version_file.read(), re.M)
+    version_groups = VERSION_RE.search(version_file.read())
     if version_groups:
         version = version_groups.group(1)
     else:
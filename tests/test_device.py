@@ -0,0 +1,134 @@
+"""Tests for the Device model."""
+
+import asyncio
+import json
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pynintendoparental.device import Device
+from pynintendoparental.player import Player
+
+PLAYER_ID = "0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d"
+
+
+def _build_api(daily_summaries: list) -> MagicMock:
+    """Returns a mocked Api answering each endpoint with a freshly decoded payload."""
+    responses = {
+        "get_device_daily_summaries": {"items": daily_summaries},
+        "get_device_parental_control_setting": {
+            "playTimerRegulations": {
+                "restrictionMode": "ALARM",
+                "timerMode": "DAILY",
+                "dailyRegulations": {
+                    "timeToPlayInOneDay": {"enabled": True, "limitTime": 60},
+                    "bedtime": {"enabled": False}
+                }
+            },
+            "whitelistedApplications": {}
+        },
+        "get_device_monthly_summaries": {"indexes": ["2023-09"]},
+        "get_device_monthly_summary": {"insights": {"thisMonth": {"playingTime": 0}}},
+        "get_account_device": {"device": {"alarmSetting": {"visibility": "VISIBLE"}}}
+    }
+
+    async def send_request(endpoint: str, body: object = None, **kwargs):
+        return {"status": 200, "json": json.loads(json.dumps(responses[endpoint]))}
+
+    api = MagicMock()
+    api.account_id = "account"
+    api.send_request = AsyncMock(side_effect=send_request)
+    return api
+
+
+def _daily_summary(nickname: str = "Player", playing_time: int = 60) -> dict:
+    """Returns a daily summary for today with a single player."""
+    return {
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        "playingTime": playing_time,
+        "devicePlayers": [{
+            "playerId": PLAYER_ID,
+            "imageUri": "https://example.com/image.png",
+            "nickname": nickname,
+            "playingTime": playing_time,
+            "playedApps": []
+        }]
+    }
+
+
+def _build_device(api: MagicMock) -> Device:
+    """Returns a device as parsed from the account devices response."""
+    return Device.from_device_response({
+        "deviceId": "device",
+        "label": "Switch",
+        "parentalControlSettingState": {"updatedAt": 0}
+    }, api)
+
+
+def test_update_builds_players():
+    """The first update builds the players from the daily summary."""
+    device = _build_device(_build_api([_daily_summary()]))
+    asyncio.run(device.update())
+
+    assert isinstance(device.players, list)
+    assert [p.player_id for p in device.players] == [PLAYER_ID]
+    assert isinstance(device.get_player(PLAYER_ID), Player)
+    assert device.get_player(PLAYER_ID) is device.players[0]
+
+
+def test_update_refreshes_players():
+    """Later updates refresh the existing players in place."""
+    api = _build_api([_daily_summary()])
+    device = _build_device(api)
+    asyncio.run(device.update())
+    player = device.players[0]
+
+    api.send_request.side_effect = _build_api(
+        [_daily_summary(nickname="Renamed", playing_time=120)]
+    ).send_request.side_effect
+    asyncio.run(device.update())
+
+    assert device.players == [player]
+    assert player.nickname == "Renamed"
+    assert player.playing_time == 120
+
+
+def test_update_without_daily_summaries():
+    """A device without daily summaries updates without any players."""
+    device = _build_device(_build_api([]))
+    asyncio.run(device.update())
+
+    assert device.players == []
+    with pytest.raises(ValueError):
+        device.get_player(PLAYER_ID)
+
+
+def test_players_read_only():
+    """Players are exposed from the id index and cannot be replaced."""
+    device = _build_device(_build_api([_daily_summary()]))
+    asyncio.run(device.update())
+
+    with pytest.raises(AttributeError):
+        device.players = []
+    device.players.clear()
+    assert device.get_player(PLAYER_ID) is device.players[0]
+
+
+def test_update_without_recent_daily_summary(caplog):
+    """Stats are flagged as failed when neither today nor yesterday has a summary."""
+    stale_summary = _daily_summary(playing_time=600)
+    stale_summary["date"] = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+    device = _build_device(_build_api([stale_summary]))
+    asyncio.run(device.update())
+
+    assert device.stats_update_failed
+    assert device.application_update_failed
+    assert device.today_playing_time == 0
+    assert device.today_disabled_time == 0
+    assert device.today_exceeded_time == 0
+    assert device.today_important_info == []
+    assert device.today_notices == []
+    assert device.today_observations == []
+    assert "does not exist" in caplog.text
@@ -0,0 +1,54 @@
+"""Tests for the Player model."""
+
+import json
+
+from pynintendoparental.player import Player
+
+
+def _daily_summaries(nickname: str = "Player", playing_time: int = 60) -> list[dict]:
+    """Returns a freshly decoded daily summaries payload with a single player."""
+    return json.loads(json.dumps([{
+        "date": "2023-10-30",
+        "devicePlayers": [{
+            "playerId": "0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d",
+            "imageUri": "https://example.com/image.png",
+            "nickname": nickname,
+            "playingTime": playing_time,
+            "playedApps": []
+        }]
+    }]))
+
+
+def test_from_device_daily_summary():
+    """Players are built from the first daily summary."""
+    players = Player.from_device_daily_summary(_daily_summaries())
+    assert len(players) == 1
+    assert players[0].player_id == "0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d"
+    assert players[0].nickname == "Player"
+    assert players[0].playing_time == 60
+    assert players[0].apps == []
+
+
+def test_from_device_daily_summary_empty():
+    """No players are built when there are no daily summaries."""
+    assert Player.from_device_daily_summary([]) == []
+    assert Player.index_from_device_daily_summary([]) == {}
+
+
+def test_update_from_daily_summary():
+    """A player is updated from a separately decoded payload with an equal player id."""
+    player = Player.from_device_daily_summary(_daily_summaries())[0]
+    updated = _daily_summaries(nickname="Renamed", playing_time=120)
+    assert updated[0]["devicePlayers"][0]["playerId"] is not player.player_id
+
+    player.update_from_daily_summary(updated)
+    assert player.nickname == "Renamed"
+    assert player.playing_time == 120
+
+
+def test_update_from_daily_summary_empty():
+    """Updating from an empty payload leaves the player untouched."""
+    player = Player.from_device_daily_summary(_daily_summaries())[0]
+    player.update_from_daily_summary([])
+    assert player.nickname == "Player"
+    assert player.playing_time == 60